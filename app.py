@@ -1,17 +1,39 @@
 from flask import Flask, render_template, request, jsonify
+from flask.json.provider import JSONProvider
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth
-import base64
-from datetime import datetime, timedelta
+from urllib3.util import Retry
+import logging
+from datetime import datetime
 from dotenv import load_dotenv
 import os
-import re
+import redis
+from rq import Queue
+import random
+import threading
 import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from functools import wraps
+from stk_payload import build_stk_payload, validate_amount, validate_phone_number
+from tasks import process_callback
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+class OrjsonProvider(JSONProvider):
+    """Route jsonify and request.get_json through orjson"""
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 
 # M-Pesa credentials
 CONSUMER_KEY = os.getenv("CONSUMER_KEY")
@@ -20,19 +42,134 @@ BUSINESS_SHORT_CODE = os.getenv("BUSINESS_SHORT_CODE")
 PASSKEY = os.getenv("PASSKEY")
 CALLBACK_URL = os.getenv("CALLBACK_URL")
 
+# Validate required environment variables at import so gunicorn workers fail at boot
+required_vars = ['CONSUMER_KEY', 'CONSUMER_SECRET', 'BUSINESS_SHORT_CODE', 'PASSKEY', 'CALLBACK_URL']
+missing_vars = [var for var in required_vars if not os.getenv(var)]
+
+if missing_vars:
+    raise RuntimeError(f"Missing required environment variables: {', '.join(missing_vars)}")
+
 # Configuration
 SANDBOX_BASE_URL = "https://sandbox.safaricom.co.ke"
 PRODUCTION_BASE_URL = "https://api.safaricom.co.ke"
 BASE_URL = SANDBOX_BASE_URL  # Change to PRODUCTION_BASE_URL for live environment
+_TOKEN_URL = f"{BASE_URL}/oauth/v1/generate?grant_type=client_credentials"
+_STK_URL = f"{BASE_URL}/mpesa/stkpush/v1/processrequest"
+_TOKEN_AUTH = HTTPBasicAuth(CONSUMER_KEY, CONSUMER_SECRET)
+
+# Constant part of the STK password; only the timestamp changes per request
+_PW_PREFIX = f"{BUSINESS_SHORT_CODE}{PASSKEY}".encode('utf-8')
+
+# STK push fields that are the same for every request
+_PAYLOAD_BASE = {
+    "BusinessShortCode": BUSINESS_SHORT_CODE,
+    "TransactionType": "CustomerPayBillOnline",
+    "PartyB": BUSINESS_SHORT_CODE,
+    "CallBackURL": CALLBACK_URL
+}
+
+# HTTP statuses worth retrying; anything else from Daraja is treated as permanent
+RETRYABLE_STATUS_CODES = (429, 500, 502, 503, 504)
+
+# Shared HTTP session so the TLS connection to Daraja is reused between calls,
+# with transient failures retried by urllib3 (honouring Retry-After on 429)
+SESSION = requests.Session()
+SESSION.mount('https://', HTTPAdapter(
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=RETRYABLE_STATUS_CODES,
+        allowed_methods=frozenset(['GET']),
+        respect_retry_after_header=True
+    ),
+    pool_connections=10,
+    pool_maxsize=50,
+    pool_block=False
+))
+# Daraja may already have accepted an STK push that timed out or got a 5xx, and
+# resending it prompts the customer again; only retry when it was never processed
+SESSION.mount(_STK_URL, HTTPAdapter(
+    max_retries=Retry(
+        total=3,
+        read=0,
+        other=0,
+        backoff_factor=0.3,
+        status_forcelist=(429,),
+        allowed_methods=frozenset(['POST']),
+        respect_retry_after_header=True
+    ),
+    pool_connections=10,
+    pool_maxsize=50,
+    pool_block=False
+))
+SESSION.headers.update({"Content-Type": "application/json"})
 
-# Token caching
+# Cap on concurrent STK push calls to Daraja from this process
+MAX_INFLIGHT_STK = int(os.getenv("MAX_INFLIGHT_STK", "20"))
+_PAY_SEM = threading.BoundedSemaphore(MAX_INFLIGHT_STK)
+# How long a request may wait for a free slot before /pay answers 503
+STK_SLOT_TIMEOUT = float(os.getenv("STK_SLOT_TIMEOUT", "5"))
+
+# Token caching (timestamps are on the time.monotonic() clock)
 access_token_cache = {
     'token': None,
-    'expires_at': None
+    'expires_at': None,
+    'stale_until': None,
+    'refresh_failed_at': None,
+    'refresh_error': None
+}
+TOKEN_REFRESH_AHEAD = 60  # seconds before expiry to refresh in the background
+TOKEN_STALE_GRACE = 240  # seconds past expiry a token may be served if refresh fails
+TOKEN_REFRESH_RETRY_INTERVAL = 10  # seconds to wait after a failed refresh before trying again
+
+# Last /readyz result, so probes don't hit Daraja on every poll
+readiness_cache = {
+    'checked_at': None,
+    'error': None
 }
+READINESS_CACHE_SECONDS = 30
+
+# Optional Redis cache so every worker shares one token (set REDIS_URL to enable)
+REDIS_URL = os.getenv("REDIS_URL")
+redis_client = redis.Redis.from_url(REDIS_URL, decode_responses=True) if REDIS_URL else None
+TOKEN_CACHE_KEY = "daraja:token"
+TOKEN_LOCK_KEY = "daraja:token:lock"
+TOKEN_FETCH_TIMEOUT = 30  # seconds per attempt
+# Long enough for a whole fetch: the first attempt plus 3 adapter retries, and backoff
+TOKEN_LOCK_TIMEOUT = TOKEN_FETCH_TIMEOUT * 4 + 10
+
+# Deletes the lock only if it still holds our value, so an expired lock that
+# another worker has since taken is left alone
+_release_lock_script = redis_client.register_script("""
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+""") if redis_client else None
+
+# Callbacks are processed by an RQ worker when Redis is configured (rq needs a bytes connection)
+callback_queue = Queue('daraja-callbacks', connection=redis.Redis.from_url(REDIS_URL)) if REDIS_URL else None
+
+# Serializes token refreshes within a worker so concurrent requests share one fetch
+_TOKEN_LOCK = threading.Lock()
+
+# Shared pool for work that shouldn't hold up a request (token refresh, inline callbacks)
+_IO_EXECUTOR = ThreadPoolExecutor(max_workers=32)
+
+def _request_error(error):
+    """Return the requests error behind an exception, if there is one"""
+    if isinstance(error, requests.exceptions.RequestException):
+        return error
+    if isinstance(error.__cause__, requests.exceptions.RequestException):
+        return error.__cause__
+    return None
 
-def retry_on_failure(max_retries=3, delay=1):
-    """Decorator to retry function calls on failure"""
+def _is_transient(error):
+    """Check whether an error is worth retrying on top of the adapter's own retries"""
+    return isinstance(_request_error(error), requests.exceptions.ConnectionError)
+
+def retry_on_failure(max_retries=3, base=0.25, cap=8.0):
+    """Decorator to retry transient failures with exponential backoff and full jitter"""
     def decorator(func):
         @wraps(func)
         def wrapper(*args, **kwargs):
@@ -40,89 +177,200 @@ def retry_on_failure(max_retries=3, delay=1):
                 try:
                     return func(*args, **kwargs)
                 except Exception as e:
-                    if attempt == max_retries - 1:
+                    if attempt == max_retries - 1 or not _is_transient(e):
                         raise
-                    time.sleep(delay)
+                    time.sleep(random.uniform(0, min(cap, base * (2 ** attempt))))
             return None
         return wrapper
     return decorator
 
-def validate_phone_number(phone):
-    """Validate and standardize phone number to Kenyan format"""
-    if not phone:
-        raise ValueError("Phone number is required")
+def _cache_token(token, expires_at):
+    """Store a token locally, remembering how long it may be served stale"""
+    access_token_cache['token'] = token
+    access_token_cache['expires_at'] = expires_at
+    access_token_cache['stale_until'] = expires_at + TOKEN_STALE_GRACE
+
+def _get_shared_token(current_time, min_ttl=0):
+    """Load the token cached in Redis by any worker into the local cache"""
+    try:
+        with redis_client.pipeline() as pipe:
+            token, ttl = pipe.get(TOKEN_CACHE_KEY).ttl(TOKEN_CACHE_KEY).execute()
+    except redis.RedisError:
+        return None
     
-    # Remove all non-digit characters
-    phone = re.sub(r'\D', '', str(phone))
+    if not token or ttl <= min_ttl:
+        return None
     
-    # Handle different formats
-    if phone.startswith('254'):
-        # Already in correct format (254XXXXXXXXX)
-        if len(phone) != 12:
-            raise ValueError("Invalid phone number format")
-        return phone
-    elif phone.startswith('0'):
-        # Kenyan format starting with 0 (0XXXXXXXXX)
-        if len(phone) != 10:
-            raise ValueError("Invalid phone number format")
-        return '254' + phone[1:]
-    elif phone.startswith('7') or phone.startswith('1'):
-        # Without country code or leading zero (XXXXXXXXX)
-        if len(phone) != 9:
-            raise ValueError("Invalid phone number format")
-        return '254' + phone
-    else:
-        raise ValueError("Unsupported phone number format")
-
-def validate_amount(amount):
-    """Validate transaction amount"""
+    _cache_token(token, current_time + ttl)
+    return token
+
+def _wait_for_shared_token(min_ttl=0):
+    """Wait for the worker holding the refresh lock to publish a new token"""
+    deadline = time.monotonic() + TOKEN_LOCK_TIMEOUT
+    while time.monotonic() < deadline:
+        time.sleep(0.1)
+        token = _get_shared_token(time.monotonic(), min_ttl)
+        if token:
+            return token
+        
+        # Stop waiting once the holder has released the lock without publishing a token
+        try:
+            if not redis_client.exists(TOKEN_LOCK_KEY):
+                return None
+        except redis.RedisError:
+            return None
+    return None
+
+def _acquire_token_lock():
+    """Take the distributed refresh lock; returns its value if this worker should fetch the token"""
+    lock_value = uuid.uuid4().hex
     try:
-        amount = float(amount)
-        if amount <= 0:
-            raise ValueError("Amount must be greater than 0")
-        if amount > 70000:  # M-Pesa daily limit
-            raise ValueError("Amount exceeds daily transaction limit")
-        return int(amount)  # M-Pesa expects integer amounts
-    except (ValueError, TypeError):
-        raise ValueError("Invalid amount format")
-
-@retry_on_failure(max_retries=3, delay=2)
-def get_access_token():
-    """Get cached access token or fetch new one"""
-    current_time = datetime.now()
-    
-    # Check if we have a valid cached token
+        if redis_client.set(TOKEN_LOCK_KEY, lock_value, nx=True, ex=TOKEN_LOCK_TIMEOUT):
+            return lock_value
+        return None
+    except redis.RedisError:
+        return lock_value
+
+def _release_token_lock(lock_value):
+    try:
+        _release_lock_script(keys=[TOKEN_LOCK_KEY], args=[lock_value])
+    except redis.RedisError:
+        pass
+
+def _get_cached_token(current_time):
+    """Return the locally cached token if it is still valid"""
     if (access_token_cache['token'] and 
         access_token_cache['expires_at'] and 
         current_time < access_token_cache['expires_at']):
         return access_token_cache['token']
+    return None
+
+def _get_stale_token(current_time):
+    """Return the last known token if it is still inside its stale grace period"""
+    if (access_token_cache['token'] and 
+        access_token_cache['stale_until'] and 
+        current_time < access_token_cache['stale_until']):
+        return access_token_cache['token']
+    return None
+
+def _refresh_failed_recently(current_time):
+    """True if a token refresh failed within the last TOKEN_REFRESH_RETRY_INTERVAL seconds"""
+    failed_at = access_token_cache['refresh_failed_at']
+    return failed_at is not None and current_time - failed_at < TOKEN_REFRESH_RETRY_INTERVAL
+
+def _refresh_token():
+    """Refresh the token in the background; the caller must hold _TOKEN_LOCK"""
+    try:
+        # Ignore shared tokens that are themselves about to need a refresh
+        _fetch_access_token(time.monotonic(), min_ttl=TOKEN_REFRESH_AHEAD)
+        access_token_cache['refresh_failed_at'] = None
+    except Exception as e:
+        access_token_cache['refresh_failed_at'] = time.monotonic()
+        access_token_cache['refresh_error'] = e
+        logger.warning("Background token refresh failed: %s", e)
+    finally:
+        _TOKEN_LOCK.release()
+
+def _start_background_refresh():
+    """Kick off a token refresh unless one is running or the last one just failed"""
+    if _refresh_failed_recently(time.monotonic()):
+        return
+    if _TOKEN_LOCK.acquire(blocking=False):
+        _IO_EXECUTOR.submit(_refresh_token)
+
+@retry_on_failure(max_retries=2)
+def get_access_token():
+    """Get cached access token or fetch new one"""
+    # Check if we have a valid cached token, refreshing it ahead of expiry
+    current_time = time.monotonic()
+    token = _get_cached_token(current_time)
+    if token:
+        if current_time >= access_token_cache['expires_at'] - TOKEN_REFRESH_AHEAD:
+            _start_background_refresh()
+        return token
+    
+    # Past expiry but still in the grace period: serve the last known token at once
+    # and refresh in the background, so requests never queue behind a slow fetch
+    token = _get_stale_token(current_time)
+    if token:
+        if access_token_cache['refresh_failed_at'] is not None:
+            logger.warning("Serving stale token after failed refresh")
+        _start_background_refresh()
+        return token
+    
+    # Only one thread refreshes; the others pick up its token once they get the lock
+    waiting_since = time.monotonic()
+    with _TOKEN_LOCK:
+        current_time = time.monotonic()
+        token = _get_cached_token(current_time) or _get_stale_token(current_time)
+        if token:
+            return token
+        
+        # If the fetch we queued behind failed, share its error rather than repeating it
+        # (a later call, such as the retry decorator's next attempt, fetches again)
+        failed_at = access_token_cache['refresh_failed_at']
+        if failed_at is not None and failed_at >= waiting_since:
+            error = access_token_cache['refresh_error']
+            raise Exception(str(error)) from error
+        
+        try:
+            token = _fetch_access_token(current_time)
+        except Exception as e:
+            access_token_cache['refresh_failed_at'] = time.monotonic()
+            access_token_cache['refresh_error'] = e
+            raise
+        access_token_cache['refresh_failed_at'] = None
+        return token
+
+def _fetch_access_token(current_time, min_ttl=0):
+    """Fetch a new token from Daraja (or another worker) and cache it"""
+    # Check if another worker already cached one, or is fetching it right now
+    lock_value = None
+    if redis_client:
+        token = _get_shared_token(current_time, min_ttl)
+        if token:
+            return token
+        
+        lock_value = _acquire_token_lock()
+        if not lock_value:
+            token = _wait_for_shared_token(min_ttl)
+            if token:
+                return token
+            # The holder gave up without a token; take over the refresh
+            lock_value = _acquire_token_lock()
     
     # Fetch new token
     try:
-        api_url = f"{BASE_URL}/oauth/v1/generate?grant_type=client_credentials"
-        response = requests.get(
-            api_url, 
-            auth=HTTPBasicAuth(CONSUMER_KEY, CONSUMER_SECRET),
-            timeout=30
+        response = SESSION.get(
+            _TOKEN_URL, 
+            auth=_TOKEN_AUTH,
+            timeout=TOKEN_FETCH_TIMEOUT
         )
         response.raise_for_status()
         
-        token_data = response.json()
+        token_data = orjson.loads(response.content)
         access_token = token_data['access_token']
         expires_in = int(token_data.get('expires_in', 3600))  # Default 1 hour
         
         # Cache the token (expire 5 minutes early for safety)
-        access_token_cache['token'] = access_token
-        access_token_cache['expires_at'] = current_time + timedelta(seconds=expires_in - 300)
+        _cache_token(access_token, current_time + expires_in - 300)
+        
+        if redis_client:
+            try:
+                redis_client.set(TOKEN_CACHE_KEY, access_token, ex=expires_in - 300)
+            except redis.RedisError:
+                pass
         
         return access_token
         
     except requests.exceptions.RequestException as e:
-        raise Exception(f"Authentication failed: {str(e)}")
+        raise Exception(f"Authentication failed: {str(e)}") from e
     except KeyError as e:
-        raise Exception("Invalid authentication response")
+        raise Exception("Invalid authentication response") from e
+    finally:
+        if lock_value:
+            _release_token_lock(lock_value)
 
-@retry_on_failure(max_retries=2, delay=3)
 def lipa_na_mpesa_online(phone_number, amount):
     """Initiate STK push with proper error handling"""
     try:
@@ -134,42 +382,33 @@ def lipa_na_mpesa_online(phone_number, amount):
         access_token = get_access_token()
         
         # Prepare API call
-        api_url = f"{BASE_URL}/mpesa/stkpush/v1/processrequest"
         headers = {
-            "Authorization": f"Bearer {access_token}",
-            "Content-Type": "application/json"
+            "Authorization": f"Bearer {access_token}"
         }
         
-        # Generate timestamp and password
-        timestamp = datetime.now().strftime('%Y%m%d%H%M%S')
-        password_string = f"{BUSINESS_SHORT_CODE}{PASSKEY}{timestamp}"
-        password = base64.b64encode(password_string.encode('utf-8')).decode('utf-8')
+        # Prepare payload (timestamp is also used for the password)
+        timestamp = time.strftime('%Y%m%d%H%M%S')
+        payload = build_stk_payload(_PAYLOAD_BASE, _PW_PREFIX, phone_number, amount, timestamp)
         
-        # Prepare payload
-        payload = {
-            "BusinessShortCode": BUSINESS_SHORT_CODE,
-            "Password": password,
-            "Timestamp": timestamp,
-            "TransactionType": "CustomerPayBillOnline",
-            "Amount": amount,
-            "PartyA": phone_number,
-            "PartyB": BUSINESS_SHORT_CODE,
-            "PhoneNumber": phone_number,
-            "CallBackURL": CALLBACK_URL,
-            "AccountReference": f"ORDER_{timestamp}",
-            "TransactionDesc": f"Payment for order {timestamp}"
-        }
-        
-        # Make API call
-        response = requests.post(
-            api_url, 
-            json=payload, 
-            headers=headers,
-            timeout=30
-        )
+        # Make API call, pushing back on the client if too many are already in flight
+        if not _PAY_SEM.acquire(timeout=STK_SLOT_TIMEOUT):
+            return {
+                'success': False,
+                'message': 'Too many payment requests in progress. Please try again shortly.',
+                'busy': True
+            }
+        try:
+            response = SESSION.post(
+                _STK_URL, 
+                data=orjson.dumps(payload), 
+                headers=headers,
+                timeout=30
+            )
+        finally:
+            _PAY_SEM.release()
         response.raise_for_status()
         
-        result = response.json()
+        result = orjson.loads(response.content)
         
         # Check if the request was successful
         if result.get('ResponseCode') == '0':
@@ -224,6 +463,8 @@ def pay():
         
         if result['success']:
             return jsonify(result), 200
+        elif result.get('busy'):
+            return jsonify(result), 503, {'Retry-After': str(int(STK_SLOT_TIMEOUT) or 1)}
         else:
             return jsonify(result), 400
             
@@ -233,53 +474,76 @@ def pay():
             "message": "Payment processing failed"
         }), 500
 
+def _log_callback_failure(future):
+    """Log errors from callbacks processed on _IO_EXECUTOR"""
+    error = future.exception()
+    if error:
+        logger.error("M-Pesa callback processing failed", exc_info=error)
+
 @app.route('/callback', methods=['POST'])
 def callback():
     """Handle M-Pesa callback"""
+    body = request.get_data()
+    if not body:
+        return jsonify({"ResultCode": 1, "ResultDesc": "Invalid data"}), 400
+    
+    # Hand the raw body to the worker so M-Pesa gets its ACK straight away
+    if callback_queue:
+        try:
+            callback_queue.enqueue('tasks.process_callback', body)
+            return jsonify({"ResultCode": 0, "ResultDesc": "Accepted"}), 200
+        except Exception:
+            logger.exception("Failed to enqueue M-Pesa callback, processing in-process")
+    
     try:
-        data = request.get_json()
-        if not data:
-            return jsonify({"ResultCode": 1, "ResultDesc": "Invalid data"}), 400
-        
-        # Extract relevant information
-        stk_callback = data.get('Body', {}).get('stkCallback', {})
-        result_code = stk_callback.get('ResultCode')
-        result_desc = stk_callback.get('ResultDesc')
-        checkout_request_id = stk_callback.get('CheckoutRequestID')
-        
-        if result_code == 0:
-            # Successful transaction
-            callback_metadata = stk_callback.get('CallbackMetadata', {}).get('Item', [])
-            transaction_data = {}
-            
-            for item in callback_metadata:
-                name = item.get('Name')
-                value = item.get('Value')
-                transaction_data[name] = value
-            
-        # Always return success to M-Pesa
-        return jsonify({"ResultCode": 0, "ResultDesc": "Accepted"}), 200
-        
-    except Exception as e:
+        _IO_EXECUTOR.submit(process_callback, body).add_done_callback(_log_callback_failure)
+    except Exception:
+        # Nothing will process this callback; a non-zero code makes M-Pesa resend it
+        logger.exception("Failed to hand off M-Pesa callback")
         return jsonify({"ResultCode": 1, "ResultDesc": "Internal error"}), 500
+    
+    # Processing errors happen after the ACK, so M-Pesa doesn't retry on them
+    return jsonify({"ResultCode": 0, "ResultDesc": "Accepted"}), 200
+
+@app.route('/livez')
+def liveness_check():
+    """Liveness probe: the process is up, no external dependencies checked"""
+    return jsonify({"status": "alive"}), 200
 
 @app.route('/health')
 def health_check():
     """Health check endpoint"""
-    try:
-        # Test if we can get an access token
-        token = get_access_token()
-        return jsonify({
-            "status": "healthy",
-            "timestamp": datetime.now().isoformat(),
-            "token_cached": bool(access_token_cache['token'])
-        }), 200
-    except Exception as e:
+    # Report on the cached token without calling Daraja; a cold or idle worker has
+    # no token yet and is still healthy (Daraja problems are reported by /readyz)
+    return jsonify({
+        "status": "healthy",
+        "timestamp": datetime.now().isoformat(),
+        "token_cached": bool(_get_cached_token(time.monotonic()))
+    }), 200
+
+@app.route('/readyz')
+def readiness_check():
+    """Readiness probe: can we get a Daraja token (result cached for 30 seconds)"""
+    current_time = time.monotonic()
+    if (readiness_cache['checked_at'] is None or 
+        current_time - readiness_cache['checked_at'] >= READINESS_CACHE_SECONDS):
+        try:
+            get_access_token()
+            readiness_cache['error'] = None
+        except Exception as e:
+            readiness_cache['error'] = str(e)
+        readiness_cache['checked_at'] = current_time
+    
+    if readiness_cache['error']:
         return jsonify({
-            "status": "unhealthy",
-            "error": str(e),
+            "status": "not ready",
+            "error": readiness_cache['error'],
             "timestamp": datetime.now().isoformat()
-        }), 500
+        }), 503
+    return jsonify({
+        "status": "ready",
+        "timestamp": datetime.now().isoformat()
+    }), 200
 
 @app.errorhandler(404)
 def not_found(error):
@@ -290,11 +554,9 @@ def internal_error(error):
     return jsonify({"success": False, "message": "Internal server error"}), 500
 
 if __name__ == '__main__':
-    # Validate required environment variables
-    required_vars = ['CONSUMER_KEY', 'CONSUMER_SECRET', 'BUSINESS_SHORT_CODE', 'PASSKEY', 'CALLBACK_URL']
-    missing_vars = [var for var in required_vars if not os.getenv(var)]
-    
-    if missing_vars:
-        exit(1)
+    # The Werkzeug server is for development only; in production run
+    # gunicorn -c gunicorn_conf.py app:app
+    if os.getenv('FLASK_ENV') != 'development':
+        exit("Set FLASK_ENV=development to use the dev server, or run: gunicorn -c gunicorn_conf.py app:app")
     
-    app.run(debug=True, host='0.0.0.0', port=5000)
\ No newline at end of file
+    app.run(debug=True, host='0.0.0.0', port=5000)
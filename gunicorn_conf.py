@@ -0,0 +1,14 @@
+"""Gunicorn settings: gunicorn -c gunicorn_conf.py app:app"""
+import multiprocessing
+import os
+
+bind = os.getenv("BIND", "0.0.0.0:5000")
+
+# gevent makes the blocking requests calls to Daraja cooperative, so each
+# worker can hold many STK pushes in flight at once
+worker_class = "gevent"
+workers = int(os.getenv("WEB_CONCURRENCY", multiprocessing.cpu_count()))
+worker_connections = 500
+
+# Daraja calls can take up to 30s (plus retries)
+timeout = 120
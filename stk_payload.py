@@ -0,0 +1,73 @@
+"""Input validation and STK push payload building.
+
+Kept free of Flask/requests imports and fully annotated so it can be
+compiled with mypyc (`mypyc stk_payload.py`); app.py imports the compiled
+extension when present and this source otherwise.
+"""
+import base64
+from typing import Any, Dict
+
+# Deletes every ASCII character except digits (str.translate runs in C)
+_DIGITS_ONLY = str.maketrans('', '', ''.join(chr(c) for c in range(128) if not chr(c).isdigit()))
+
+
+def validate_phone_number(phone: object) -> str:
+    """Validate and standardize phone number to Kenyan format"""
+    if not phone:
+        raise ValueError("Phone number is required")
+    
+    # Remove all non-digit characters (translate only covers ASCII, so fall back
+    # for pasted numbers with e.g. non-breaking spaces or dashes)
+    digits = str(phone)
+    if digits.isascii():
+        digits = digits.translate(_DIGITS_ONLY)
+    else:
+        digits = ''.join(c for c in digits if c.isdigit())
+    
+    # Strip the prefix of the supported formats down to the 9-digit subscriber number:
+    # 254XXXXXXXXX (international), 0XXXXXXXXX (local), XXXXXXXXX (no prefix)
+    if digits.startswith('254'):
+        subscriber = digits[3:]
+    elif digits[:1] == '0':
+        subscriber = digits[1:]
+    elif digits[:1] in ('7', '1'):
+        subscriber = digits
+    else:
+        raise ValueError("Unsupported phone number format")
+    
+    if len(subscriber) != 9 or not subscriber.isascii():
+        raise ValueError("Invalid phone number format")
+    return '254' + subscriber
+
+
+def validate_amount(amount: object) -> int:
+    """Validate transaction amount"""
+    # Inputs come straight from request JSON, so check types here rather than in the
+    # signature (a compiled build would reject them with TypeError at the call)
+    if not isinstance(amount, (str, int, float)):
+        raise ValueError("Invalid amount format")
+    try:
+        value = float(amount)
+        if value <= 0:
+            raise ValueError("Amount must be greater than 0")
+        if value > 70000:  # M-Pesa daily limit
+            raise ValueError("Amount exceeds daily transaction limit")
+        return int(value)  # M-Pesa expects integer amounts
+    except (ValueError, TypeError):
+        raise ValueError("Invalid amount format")
+
+
+def build_stk_payload(base: Dict[str, Any], password_prefix: bytes,
+                      phone_number: str, amount: int, timestamp: str) -> Dict[str, Any]:
+    """Build the STK push request body from the constant fields and per-request values"""
+    password = base64.b64encode(password_prefix + timestamp.encode('ascii')).decode('ascii')
+    return {
+        **base,
+        "Password": password,
+        "Timestamp": timestamp,
+        "Amount": amount,
+        "PartyA": phone_number,
+        "PhoneNumber": phone_number,
+        "AccountReference": f"ORDER_{timestamp}",
+        "TransactionDesc": f"Payment for order {timestamp}"
+    }
@@ -0,0 +1,24 @@
+"""Background jobs for the M-Pesa integration (run with `rq worker daraja-callbacks`)"""
+import orjson
+
+
+def process_callback(raw_body):
+    """Parse an STK push callback body and extract the transaction result"""
+    data = orjson.loads(raw_body)
+    
+    # Extract relevant information
+    stk_callback = data.get('Body', {}).get('stkCallback', {})
+    result = {
+        'checkout_request_id': stk_callback.get('CheckoutRequestID'),
+        'merchant_request_id': stk_callback.get('MerchantRequestID'),
+        'result_code': stk_callback.get('ResultCode'),
+        'result_desc': stk_callback.get('ResultDesc'),
+        'transaction_data': {}
+    }
+    
+    if result['result_code'] == 0:
+        # Successful transaction
+        callback_metadata = stk_callback.get('CallbackMetadata', {}).get('Item', [])
+        result['transaction_data'] = {item['Name']: item.get('Value') for item in callback_metadata if 'Name' in item}
+    
+    return result